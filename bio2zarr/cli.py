@@ -2,6 +2,7 @@ import logging
 import os
 import pathlib
 import shutil
+import threading
 
 import click
 import coloredlogs
@@ -175,7 +176,19 @@ def check_overwrite_dir(path, force):
         tmp_delete_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.DELETING")
         logger.info(f"Deleting {path} (renamed to {tmp_delete_path} while in progress)")
         os.rename(path, tmp_delete_path)
-        shutil.rmtree(tmp_delete_path)
+        # The rename above has freed up the path, so the delete itself can run in
+        # the background while we get on with the real work. The thread is
+        # non-daemon, so we won't exit until the delete has finished.
+        threading.Thread(target=delete_dir, args=(tmp_delete_path,)).start()
+
+
+def delete_dir(path):
+    try:
+        shutil.rmtree(path)
+    except OSError as e:
+        # Nothing will pick this up at the top level, so log the error here
+        # rather than dumping a traceback to stderr.
+        logger.error(f"Deleting {path} failed: {e}")
 
 
 def check_partitions(num_partitions):
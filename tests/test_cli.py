@@ -1,5 +1,6 @@
 import dataclasses
 import json
+import threading
 from unittest import mock
 
 import click.testing as ct
@@ -221,6 +222,26 @@ class TestWithMocks:
             str(icf_path), (self.vcf_path,), **DEFAULT_EXPLODE_ARGS
         )
 
+    @mock.patch("bio2zarr.vcf2zarr.explode")
+    def test_vcf_explode_overwrite_icf_deletes_tree(self, mocked, tmp_path):
+        icf_path = tmp_path / "icf"
+        icf_path.mkdir()
+        (icf_path / "chunk").touch()
+        runner = ct.CliRunner(mix_stderr=False)
+        result = runner.invoke(
+            cli.vcf2zarr_main,
+            f"explode {self.vcf_path} {icf_path} --force",
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        # The path is renamed out of the way synchronously, but the delete
+        # itself happens in a background thread.
+        assert not icf_path.exists()
+        for thread in threading.enumerate():
+            if thread is not threading.main_thread():
+                thread.join(timeout=10)
+        assert list(tmp_path.iterdir()) == []
+
     @pytest.mark.parametrize("force_arg", ["-f", "--force"])
     @mock.patch("bio2zarr.vcf2zarr.encode")
     def test_vcf_encode_overwrite_icf_force(self, mocked, tmp_path, force_arg):